@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from ucas_offers_monitor import ConfigStore, MonitorManager, UCASOffersMonitor
+
+
+def make_store(tmp_path, legacy_config=None):
+    legacy_file = tmp_path / 'ucas-offersmonitor-cookies.json'
+    if legacy_config is not None:
+        legacy_file.write_text(json.dumps(legacy_config), encoding='utf-8')
+    return ConfigStore(str(tmp_path / 'accounts'), str(legacy_file))
+
+
+def test_save_replaces_record(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.save('alice', {'cookies': 'a=2'})
+
+    assert store.load('alice') == {'cookies': 'a=2'}
+    assert os.listdir(store.directory) == ['alice.json']
+
+
+def test_failed_save_keeps_old_record_and_leaves_no_temp_file(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+
+    with pytest.raises(TypeError):
+        store.save('alice', {'cookies': object()})
+
+    assert store.load('alice') == {'cookies': 'a=1'}
+    assert os.listdir(store.directory) == ['alice.json']
+
+
+def test_save_only_rewrites_its_own_record(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.save('bob', {'cookies': 'b=1'})
+    bob_mtime = os.stat(store.record_path('bob')).st_mtime_ns
+
+    store.save('alice', {'cookies': 'a=2'})
+
+    assert os.stat(store.record_path('bob')).st_mtime_ns == bob_mtime
+
+
+def test_legacy_config_is_migrated_to_default_account(tmp_path):
+    store = make_store(tmp_path, {'cookies': 'a=1', 'bark_key': 'k'})
+
+    assert store.list_accounts() == ['default']
+    assert store.load('default') == {'cookies': 'a=1', 'bark_key': 'k'}
+
+
+def test_legacy_config_is_not_migrated_over_existing_accounts(tmp_path):
+    make_store(tmp_path).save('alice', {'cookies': 'a=1'})
+
+    store = make_store(tmp_path, {'cookies': 'old'})
+
+    assert store.list_accounts() == ['alice']
+
+
+def test_poll_changes_reports_added_removed_and_modified(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.save('bob', {'cookies': 'b=1'})
+    assert store.poll_changes() == (['alice', 'bob'], [], [])
+
+    with open(store.record_path('alice'), 'w', encoding='utf-8') as f:
+        json.dump({'cookies': 'a=22'}, f)
+    os.remove(store.record_path('bob'))
+    with open(store.record_path('carol'), 'w', encoding='utf-8') as f:
+        json.dump({'cookies': 'c=1'}, f)
+
+    assert store.poll_changes() == (['carol'], ['bob'], ['alice'])
+    assert store.poll_changes() == ([], [], [])
+
+
+def test_poll_changes_ignores_own_saves(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.poll_changes()
+
+    store.save('alice', {'cookies': 'a=2'})
+
+    assert store.poll_changes() == ([], [], [])
+
+
+def test_poll_changes_sees_replace_within_same_mtime(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.poll_changes()
+    mtime_ns = os.stat(store.record_path('alice')).st_mtime_ns
+
+    replacement = os.path.join(store.directory, '.alice.edit')
+    with open(replacement, 'w', encoding='utf-8') as f:
+        json.dump({'cookies': 'a=2'}, f)
+    os.utime(replacement, ns=(mtime_ns, mtime_ns))
+    os.replace(replacement, store.record_path('alice'))
+
+    assert store.poll_changes() == ([], [], ['alice'])
+
+
+def test_relogin_save_keeps_concurrent_hand_edit(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.poll_changes()
+    monitor = UCASOffersMonitor(store, 'alice')
+
+    with open(store.record_path('alice'), 'w', encoding='utf-8') as f:
+        json.dump({'cookies': 'a=1', 'webhook': {'url': 'https://example.com/hook'}}, f)
+    monitor.config['cookies'] = 'a=2'
+    monitor.save_config(['cookies'])
+
+    expected = {'cookies': 'a=2', 'webhook': {'url': 'https://example.com/hook'}}
+    assert store.load('alice') == expected
+    assert monitor.config == expected
+    assert store.poll_changes() == ([], [], [])
+
+
+def test_stopped_monitor_does_not_recreate_removed_record(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    store.poll_changes()
+    monitor = UCASOffersMonitor(store, 'alice')
+
+    os.remove(store.record_path('alice'))
+    assert store.poll_changes() == ([], ['alice'], [])
+    monitor.stop()
+    monitor.save_config()
+    monitor.config['cookies'] = 'a=2'
+    store.save('alice', monitor.config, ['cookies'])
+
+    assert store.poll_changes() == ([], [], [])
+    assert store.list_accounts() == []
+
+
+def test_reload_keeps_config_when_record_is_corrupt(tmp_path):
+    store = make_store(tmp_path)
+    store.save('alice', {'cookies': 'a=1'})
+    monitor = UCASOffersMonitor(store, 'alice')
+
+    with open(store.record_path('alice'), 'w', encoding='utf-8') as f:
+        f.write('{"cookies": ')
+    monitor.reload_config()
+
+    assert monitor.config == {'cookies': 'a=1'}
+
+
+def test_watcher_picks_up_accounts_after_all_monitors_stopped(tmp_path, monkeypatch):
+    monkeypatch.setattr(UCASOffersMonitor, 'check_config', lambda self: True)
+    monkeypatch.setattr(UCASOffersMonitor, 'monitor_offers', lambda self: None)
+    store = make_store(tmp_path)
+    manager = MonitorManager(store)
+    manager.watch_interval = 0.05
+    store.poll_changes()
+    threading.Thread(target=manager.watch_accounts, daemon=True).start()
+
+    time.sleep(0.2)
+    store.save('alice', {'cookies': 'a=1'})
+    deadline = time.time() + 5
+    while 'alice' not in manager.monitors and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert 'alice' in manager.monitors
@@ -0,0 +1,253 @@
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ucas_offers_monitor import NotificationDispatcher, WebhookNotifier, build_notifiers
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if self.path == '/slow':
+            time.sleep(3)
+        elif self.path == '/busy':
+            time.sleep(0.3)
+        self.server.received.append((self.path, json.loads(body)))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.reply('220 localhost')
+        data = None
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode().rstrip('\r\n')
+            if data is not None:
+                if line == '.':
+                    self.server.messages.append('\n'.join(data))
+                    data = None
+                    self.reply('250 OK')
+                else:
+                    data.append(line)
+                continue
+            command = line.split(' ')[0].upper()
+            if command in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                data = []
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class ThreadingSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    block_on_close = False
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def http_sink():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SinkHandler)
+    server.daemon_threads = True
+    server.block_on_close = False
+    server.received = []
+    yield serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def smtp_server():
+    server = ThreadingSMTPServer(('127.0.0.1', 0), SMTPHandler)
+    server.messages = []
+    yield serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+def channel_config(http_sink, smtp_server, path='/hook', **webhook):
+    return {
+        'webhook': dict({'url': f"http://127.0.0.1:{http_sink.server_port}{path}"}, **webhook),
+        'email': {
+            'smtp_host': '127.0.0.1',
+            'smtp_port': smtp_server.server_address[1],
+            'use_ssl': False,
+            'sender': 'monitor@example.com',
+            'to': 'me@example.com'
+        }
+    }
+
+
+def test_fans_out_to_every_channel_and_reports_latency(http_sink, smtp_server, capsys):
+    notifiers = build_notifiers(channel_config(http_sink, smtp_server))
+
+    assert NotificationDispatcher().dispatch(notifiers, '🎉 New offer', 'Check UCAS')
+
+    assert http_sink.received[0][0] == '/hook'
+    assert http_sink.received[0][1]['title'] == '🎉 New offer'
+    assert http_sink.received[0][1]['critical'] is True
+    assert 'Check UCAS' in smtp_server.messages[0]
+    output = capsys.readouterr().out
+    assert '推送通知已发送 [webhook]' in output
+    assert '推送通知已发送 [email]' in output
+
+
+def test_slow_webhook_times_out_without_delaying_email(http_sink, smtp_server):
+    config = channel_config(http_sink, smtp_server, '/slow', timeout=0.5)
+    results = NotificationDispatcher().deliver_all(build_notifiers(config), 'title', 'message')
+
+    by_name = {notifier.name: (sent, latency_ms) for notifier, sent, latency_ms, _ in results}
+    assert by_name['webhook'][0] is False
+    assert by_name['webhook'][1] >= 500
+    assert by_name['email'][0] is True
+    assert by_name['email'][1] < 500
+    assert len(smtp_server.messages) == 1
+
+
+def test_concurrency_limit_serialises_sends(http_sink):
+    url = f"http://127.0.0.1:{http_sink.server_port}/busy"
+    notifiers = [WebhookNotifier(url, timeout=5, concurrency=1) for _ in range(3)]
+
+    results = NotificationDispatcher().deliver_all(notifiers, 'title', 'message')
+
+    latencies = sorted(latency_ms for _, sent, latency_ms, _ in results if sent)
+    assert len(latencies) == 3
+    assert latencies[1] - latencies[0] >= 250
+    assert latencies[2] - latencies[1] >= 250
+
+
+def test_changed_concurrency_gets_its_own_pool(http_sink):
+    url = f"http://127.0.0.1:{http_sink.server_port}/busy"
+    dispatcher = NotificationDispatcher()
+    dispatcher.deliver_all([WebhookNotifier(url, concurrency=1)], 'title', 'message')
+
+    notifiers = [WebhookNotifier(url, timeout=5, concurrency=3) for _ in range(3)]
+    results = dispatcher.deliver_all(notifiers, 'title', 'message')
+
+    assert max(latency_ms for _, _, latency_ms, _ in results) < 600
+    assert sorted(dispatcher.pools) == [(f"webhook:{url}", 1), (f"webhook:{url}", 3)]
+    dispatcher.close()
+
+
+def test_alternating_concurrency_across_accounts_delivers_every_send(http_sink):
+    url = f"http://127.0.0.1:{http_sink.server_port}/hook"
+    dispatcher = NotificationDispatcher()
+    outcomes = []
+
+    def send(concurrency):
+        for _ in range(5):
+            results = dispatcher.deliver_all([WebhookNotifier(url, timeout=5, concurrency=concurrency)], 'title', 'message')
+            outcomes.extend(sent for _, sent, _, _ in results)
+
+    threads = [threading.Thread(target=send, args=(concurrency,)) for concurrency in (1, 2, 1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes == [True] * 20
+    assert len(dispatcher.pools) == 2
+    dispatcher.close()
+
+
+class StuckNotifier:
+    name = 'stuck'
+    channel_key = 'stuck'
+    timeout = 0.1
+    concurrency = 1
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def send(self, title, message, critical=True):
+        self.release.wait(5)
+        return True
+
+
+def test_send_running_past_deadline_is_unconfirmed_and_queued_one_is_cancelled(capsys):
+    running, queued = StuckNotifier(), StuckNotifier()
+    dispatcher = NotificationDispatcher()
+
+    assert dispatcher.dispatch([running, queued], 'title', 'message') is False
+
+    output = capsys.readouterr().out
+    assert '推送结果未确认 [stuck]' in output
+    assert '推送失败 [stuck]' in output
+    running.release.set()
+    dispatcher.close()
+
+
+def test_close_shuts_down_channel_pools(http_sink):
+    url = f"http://127.0.0.1:{http_sink.server_port}/hook"
+    dispatcher = NotificationDispatcher()
+    dispatcher.deliver_all([WebhookNotifier(url)], 'title', 'message')
+    pool = dispatcher.pools[(f"webhook:{url}", 4)]
+
+    dispatcher.close()
+
+    assert dispatcher.pools == {}
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+
+def test_build_notifiers_skips_bad_channels():
+    logged = []
+    notifiers = build_notifiers({
+        'bark_key': 'k',
+        'bark': {'timeout': '5', 'concurrency': 'many'},
+        'webhook': {'url': 'https://example.com/hook', 'enabled': True, 'timeout': '3'},
+        'email': {'smtp_host': 'smtp.example.com'}
+    }, logged.append)
+
+    assert [n.name for n in notifiers] == ['bark', 'webhook']
+    assert (notifiers[0].timeout, notifiers[0].concurrency) == (5.0, 4)
+    assert notifiers[1].timeout == 3.0
+    assert logged == ["推送渠道 email 缺少 smtp_host 或 to，已跳过"]
+
+
+def test_build_notifiers_ignores_malformed_sections():
+    logged = []
+
+    assert build_notifiers({'webhook': 'https://example.com', 'email': {'timeout': -1}}, logged.append) == []
+    assert len(logged) == 2
+
+
+def test_build_notifiers_skips_email_without_sender():
+    logged = []
+    notifiers = build_notifiers({
+        'email': {'smtp_host': 'relay.example.com', 'use_ssl': False, 'to': 'me@example.com'}
+    }, logged.append)
+
+    assert notifiers == []
+    assert logged == ["推送渠道 email 缺少 sender 或 username，无法设置发件人，已跳过"]
+
+
+def test_email_sender_defaults_to_username():
+    notifiers = build_notifiers({
+        'email': {'smtp_host': 'smtp.example.com', 'username': 'me@example.com', 'to': ['me@example.com']}
+    })
+
+    assert notifiers[0].sender == 'me@example.com'
@@ -5,9 +5,14 @@ import os
 import sys
 import signal
 import re
+import tempfile
+import threading
 from datetime import datetime, timedelta
 from urllib.parse import quote
 import base64
+import smtplib
+from concurrent.futures import ThreadPoolExecutor, wait
+from email.message import EmailMessage
 import uuid
 try:
     from zoneinfo import ZoneInfo
@@ -64,32 +69,381 @@ def show_muse_banner():
     print("=" * 88)
     print()
 
-class UCASOffersMonitor:
+class ConfigStore:
+    def __init__(self, directory='ucas-offersmonitor-accounts', legacy_file='ucas-offersmonitor-cookies.json'):
+        self.directory = directory
+        self.legacy_file = legacy_file
+        self.known = {}
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.migrate_legacy_config()
+
+    def migrate_legacy_config(self):
+        if not os.path.exists(self.legacy_file) or self.scan():
+            return
+        try:
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                legacy_config = json.load(f)
+            if legacy_config:
+                self.save('default', legacy_config)
+                print(f"已将旧配置文件 {self.legacy_file} 迁移为账号 default")
+        except Exception as e:
+            print(f"旧配置文件迁移失败: {e}")
+
+    def normalize_account(self, account):
+        account = re.sub(r'[^A-Za-z0-9_.@-]', '_', (account or '').strip()).strip('.')
+        return account or 'default'
+
+    def record_path(self, account):
+        return os.path.join(self.directory, f"{account}.json")
+
+    def scan(self):
+        records = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.name.endswith('.json'):
+                        continue
+                    signature = self.record_signature(entry.path)
+                    if signature:
+                        records[entry.name[:-5]] = signature
+        except FileNotFoundError:
+            pass
+        return records
+
+    def record_signature(self, path):
+        # mtime alone misses a replace that lands in the same clock tick; size and inode catch it
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def list_accounts(self):
+        return sorted(self.scan())
+
+    def load(self, account):
+        try:
+            with open(self.record_path(account), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[{account}] 配置文件加载失败: {e}")
+            return None
+
+    def save(self, account, record, keys=None):
+        path = self.record_path(account)
+        # the whole check-write-record sequence runs under the lock so poll_changes never sees our own write as an edit
+        with self.lock:
+            if keys is not None:
+                signature = self.record_signature(path)
+                if signature is None:
+                    # a partial update never recreates a record that was removed
+                    return None
+                if account in self.known and signature != self.known[account]:
+                    on_disk = self.load(account)
+                    if on_disk is not None:
+                        record = dict(on_disk, **{key: record[key] for key in keys if key in record})
+            self.write_record(account, path, record)
+            if account in self.known:
+                self.known[account] = self.record_signature(path)
+        self.fsync_directory()
+        return record
+
+    def write_record(self, account, path, record):
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{account}.", suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            for attempt in range(3):
+                try:
+                    os.replace(tmp_path, path)
+                    break
+                except PermissionError:
+                    # Windows refuses to replace a file another thread is still reading
+                    if attempt == 2:
+                        raise
+                    time.sleep(0.1)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def fsync_directory(self):
+        # the rename itself is only durable once the directory entry is flushed; Windows cannot open directories
+        if os.name == 'nt':
+            return
+        dir_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def poll_changes(self):
+        with self.lock:
+            current = self.scan()
+            added = [a for a in current if a not in self.known]
+            removed = [a for a in self.known if a not in current]
+            modified = [a for a in current if a in self.known and current[a] != self.known[a]]
+            self.known = current
+        return added, removed, modified
+
+class BarkNotifier:
+    name = 'bark'
+
+    def __init__(self, key, timeout=10, concurrency=4):
+        self.key = key
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.channel_key = f"bark:{key}"
+
+    def send(self, title, message, critical=True):
+        encoded_message = quote(message)
+        encoded_title = quote(title)
+        base = f"https://api.day.app/{self.key}/{encoded_message}?title={encoded_title}&icon=https://data.musestar.cc/files/ms.png"
+        url = base if not critical else f"{base}&level=critical&volume=10&call=1"
+        response = requests.get(url, timeout=self.timeout)
+        return response.status_code == 200
+
+class WebhookNotifier:
+    name = 'webhook'
+
+    def __init__(self, url, timeout=10, concurrency=4):
+        self.url = url
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.channel_key = f"webhook:{url}"
+
+    def send(self, title, message, critical=True):
+        payload = {
+            'title': title,
+            'message': message,
+            'critical': critical,
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        response = requests.post(self.url, json=payload, timeout=self.timeout)
+        return 200 <= response.status_code < 300
+
+class EmailNotifier:
+    name = 'email'
+
+    def __init__(self, smtp_host, to, smtp_port=465, use_ssl=True, starttls=False, username=None, password=None, sender=None, timeout=10, concurrency=2):
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.to = [to] if isinstance(to, str) else list(to)
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.channel_key = f"email:{smtp_host}:{smtp_port}"
+
+    def send(self, title, message, critical=True):
+        msg = EmailMessage()
+        msg['Subject'] = title
+        msg['From'] = self.sender
+        msg['To'] = ', '.join(self.to)
+        msg.set_content(message)
+        smtp_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+        with smtp_class(self.smtp_host, self.smtp_port, timeout=self.timeout) as smtp:
+            if self.starttls and not self.use_ssl:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+            smtp.send_message(msg)
+        return True
+
+def positive_number(value, default, cast=float):
+    if isinstance(value, bool):
+        return default
+    try:
+        value = cast(value)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+def config_flag(value, default):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ('true', 'yes', '1', 'false', 'no', '0'):
+        return value.strip().lower() in ('true', 'yes', '1')
+    return default
+
+def optional_text(value):
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+def build_notifiers(config, log=print):
+    notifiers = []
+    channels = {}
+    for name in ('bark', 'webhook', 'email'):
+        options = config.get(name)
+        if options is None:
+            options = {}
+        elif not isinstance(options, dict):
+            log(f"推送渠道 {name} 配置格式错误，已跳过")
+            continue
+        channels[name] = options
+
+    def common(options, concurrency):
+        return {
+            'timeout': positive_number(options.get('timeout'), 10.0),
+            'concurrency': positive_number(options.get('concurrency'), concurrency, int)
+        }
+
+    if 'bark' in channels:
+        options = channels['bark']
+        key = optional_text(options.get('key')) or optional_text(config.get('bark_key'))
+        if key:
+            notifiers.append(BarkNotifier(key, **common(options, 4)))
+        elif options:
+            log("推送渠道 bark 缺少 key，已跳过")
+
+    if channels.get('webhook'):
+        options = channels['webhook']
+        url = optional_text(options.get('url'))
+        if url and url.startswith(('http://', 'https://')):
+            notifiers.append(WebhookNotifier(url, **common(options, 4)))
+        else:
+            log("推送渠道 webhook 缺少有效的 url，已跳过")
+
+    if channels.get('email'):
+        options = channels['email']
+        smtp_host = optional_text(options.get('smtp_host'))
+        to = options.get('to')
+        to = [to] if isinstance(to, str) else to
+        if isinstance(to, list):
+            to = [addr.strip() for addr in to if isinstance(addr, str) and addr.strip()]
+        else:
+            to = []
+        username = optional_text(options.get('username'))
+        sender = optional_text(options.get('sender'))
+        if not (smtp_host and to):
+            log("推送渠道 email 缺少 smtp_host 或 to，已跳过")
+        elif not (sender or username):
+            log("推送渠道 email 缺少 sender 或 username，无法设置发件人，已跳过")
+        else:
+            use_ssl = config_flag(options.get('use_ssl'), True)
+            notifiers.append(EmailNotifier(
+                smtp_host,
+                to,
+                smtp_port=positive_number(options.get('smtp_port'), 465 if use_ssl else 25, int),
+                use_ssl=use_ssl,
+                starttls=config_flag(options.get('starttls'), False),
+                username=username,
+                password=options.get('password') if isinstance(options.get('password'), str) else None,
+                sender=sender,
+                **common(options, 2)
+            ))
+    return notifiers
+
+class NotificationDispatcher:
     def __init__(self):
-        self.config_file = 'ucas-offersmonitor-cookies.json'
+        self.pools = {}
+        self.lock = threading.Lock()
+
+    def submit(self, notifier, *args):
+        # one pool per channel and concurrency limit, so a backed-up channel only queues its own sends
+        # and accounts configuring different limits for the same endpoint never tear down each other's pool
+        pool_key = (notifier.channel_key, notifier.concurrency)
+        with self.lock:
+            pool = self.pools.get(pool_key)
+            if pool is None:
+                pool = ThreadPoolExecutor(max_workers=notifier.concurrency, thread_name_prefix=f"notifier-{notifier.name}")
+                self.pools[pool_key] = pool
+            return pool.submit(self.deliver, notifier, *args)
+
+    def close(self):
+        with self.lock:
+            pools = list(self.pools.values())
+            self.pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def deliver(self, notifier, title, message, critical, started):
+        if time.perf_counter() - started > notifier.timeout:
+            return False, "等待发送超时", time.perf_counter()
+        try:
+            return notifier.send(title, message, critical), None, time.perf_counter()
+        except Exception as e:
+            return False, str(e), time.perf_counter()
+
+    def deliver_all(self, notifiers, title, message, critical=True):
+        if not notifiers:
+            return []
+
+        started = time.perf_counter()
+        futures = [(self.submit(n, title, message, critical, started), n) for n in notifiers]
+        # timeout limits each network operation rather than the whole send, so this only bounds how long we wait
+        deadline = max(n.timeout for n in notifiers) * 2 + 1
+        wait([future for future, _ in futures], timeout=deadline)
+
+        results = []
+        for future, notifier in futures:
+            latency_ms = int((time.perf_counter() - started) * 1000)
+            if future.done() and not future.cancelled():
+                sent, error, finished = future.result()
+                latency_ms = int((finished - started) * 1000)
+            elif future.cancel():
+                sent, error = False, "等待发送超时"
+            else:
+                # already running and cannot be cancelled, so it may still be delivered
+                sent, error = None, "发送超过等待时限"
+            results.append((notifier, sent, latency_ms, error))
+        return results
+
+    def dispatch(self, notifiers, title, message, critical=True, log=print):
+        all_sent = True
+        for notifier, sent, latency_ms, error in self.deliver_all(notifiers, title, message, critical):
+            if sent:
+                log(f"推送通知已发送 [{notifier.name}] {latency_ms}ms")
+            elif sent is None:
+                all_sent = False
+                log(f"推送结果未确认 [{notifier.name}] {latency_ms}ms: {error}，可能稍后送达")
+            else:
+                all_sent = False
+                log(f"推送失败 [{notifier.name}] {latency_ms}ms: {error or '服务器返回错误'}，仅控制台显示")
+        return all_sent
+
+class UCASOffersMonitor:
+    def __init__(self, store=None, account='default', dispatcher=None):
+        self.store = store or ConfigStore()
+        self.account = account
+        self.dispatcher = dispatcher or NotificationDispatcher()
         self.config = self.load_config()
         self.last_offers_count = None
         self.login_retry_count = 0
         self.max_login_retries = 2
-        
+        self.stop_event = threading.Event()
+        self.config_lock = threading.RLock()
+
+    def log(self, message):
+        print(f"[{self.account}] {message}")
+
     def load_config(self):
+        return self.store.load(self.account) or {}
+
+    def reload_config(self):
+        config = self.store.load(self.account)
+        if config is not None:
+            with self.config_lock:
+                self.config = config
+
+    def save_config(self, keys=None):
+        if self.stop_event.is_set():
+            return
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {}
-        except Exception as e:
-            print(f"配置文件加载失败: {e}")
-            return {}
-    
-    def save_config(self):
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            with self.config_lock:
+                saved = self.store.save(self.account, self.config, keys)
+                if saved is not None:
+                    self.config = saved
         except Exception as e:
-            print(f"配置文件保存失败: {e}")
-    
+            self.log(f"配置文件保存失败: {e}")
+
     def setup_config(self):
         print("\n请选择登录方式:")
         print("1. 直接输入cookies")
@@ -126,6 +480,12 @@ class UCASOffersMonitor:
             print("Bark推送已配置")
         else:
             print("已跳过Bark推送配置")
+        webhook_url = input("请输入Webhook推送地址 (直接回车可跳过): ").strip()
+        if webhook_url:
+            self.config['webhook'] = {'url': webhook_url}
+            print("Webhook推送已配置")
+        else:
+            print("已跳过Webhook推送配置")
         self.save_config()
         print("配置保存成功")
         return True
@@ -152,26 +512,26 @@ class UCASOffersMonitor:
             response = session.post(bootstrap_url, data=bootstrap_data, headers=headers)
             
             if response.status_code == 200:
-                print("Bootstrap cookies获取成功")
+                self.log("Bootstrap cookies获取成功")
                 return session
             else:
-                print(f"❌ Bootstrap cookies获取失败: {response.status_code}")
+                self.log(f"❌ Bootstrap cookies获取失败: {response.status_code}")
                 return None
                 
         except Exception as e:
-            print(f"❌ 获取bootstrap cookies失败: {e}")
+            self.log(f"❌ 获取bootstrap cookies失败: {e}")
             return None
 
     def extract_login_token_from_cookies(self, session):
         try:
             for cookie in session.cookies:
                 if cookie.name.startswith('glt_'):
-                    print(f"成功提取login token")
+                    self.log(f"成功提取login token")
                     return cookie.value
-            print("❌ 未找到login token")
+            self.log("❌ 未找到login token")
             return None
         except Exception as e:
-            print(f"❌ 提取login token失败: {e}")
+            self.log(f"❌ 提取login token失败: {e}")
             return None
 
     def get_jwt_token(self, session, login_token):
@@ -202,20 +562,20 @@ class UCASOffersMonitor:
                 if result.get('errorCode') == 0:
                     jwt_token = result.get('id_token')
                     if jwt_token:
-                        print(f"JWT token获取成功")
+                        self.log(f"JWT token获取成功")
                         return jwt_token
                     else:
-                        print("❌ JWT响应中未找到id_token")
+                        self.log("❌ JWT响应中未找到id_token")
                         return None
                 else:
-                    print(f"❌ 获取JWT失败: {result.get('errorMessage', '未知错误')}")
+                    self.log(f"❌ 获取JWT失败: {result.get('errorMessage', '未知错误')}")
                     return None
             else:
-                print(f"❌ JWT请求失败: {response.status_code}")
+                self.log(f"❌ JWT请求失败: {response.status_code}")
                 return None
                 
         except Exception as e:
-            print(f"❌ 获取JWT token失败: {e}")
+            self.log(f"❌ 获取JWT token失败: {e}")
             return None
 
     def parse_jwt_token(self, jwt_token):
@@ -233,7 +593,7 @@ class UCASOffersMonitor:
             return json.loads(decoded_payload)
             
         except Exception as e:
-            print(f"解析JWT token失败: {e}")
+            self.log(f"解析JWT token失败: {e}")
             return None
 
     def generate_device_id(self):
@@ -243,7 +603,7 @@ class UCASOffersMonitor:
         try:
             user_info = self.parse_jwt_token(jwt_token)
             if not user_info:
-                print("❌ 无法解析JWT token")
+                self.log("❌ 无法解析JWT token")
                 return False
             
             callback_url = "https://accounts.ucas.com/account/logincallback"
@@ -278,23 +638,23 @@ class UCASOffersMonitor:
             if response.status_code == 200:
                 for cookie in session.cookies:
                     if cookie.name == 'UcasIdentity':
-                        print("成功获取UcasIdentity cookie")
+                        self.log("成功获取UcasIdentity cookie")
                         return True
-                print("❌ 未获取到UcasIdentity cookie")
+                self.log("❌ 未获取到UcasIdentity cookie")
                 return False
             else:
-                print(f"❌ Login callback失败: {response.status_code}")
+                self.log(f"❌ Login callback失败: {response.status_code}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Login callback失败: {e}")
+            self.log(f"❌ Login callback失败: {e}")
             return False
 
     def login_with_credentials(self):
         try:
             session = self.get_bootstrap_cookies()
             if not session:
-                print("❌ 无法获取必要的cookies")
+                self.log("❌ 无法获取必要的cookies")
                 return False
             
             login_url = "https://7054541.ucas.com/accounts.login"
@@ -343,23 +703,25 @@ class UCASOffersMonitor:
                             all_cookies.append(f"{cookie.name}={cookie.value}")
                         
                         if all_cookies:
-                            self.config['cookies'] = '; '.join(all_cookies)
-                            print(f"成功保存登录信息")
+                            with self.config_lock:
+                                self.config['cookies'] = '; '.join(all_cookies)
+                                self.save_config(['cookies'])
+                            self.log(f"成功保存登录信息")
                             return True
                         else:
-                            print("❌ 登录成功但未获取到cookies")
+                            self.log("❌ 登录成功但未获取到cookies")
                             return False
                     else:
                         return False
                 else:
-                    print(f"❌ 账号密码登录失败: {result.get('errorMessage', '未知错误')}")
+                    self.log(f"❌ 账号密码登录失败: {result.get('errorMessage', '未知错误')}")
                     return False
             else:
-                print(f"❌ 登录请求失败: {response.status_code}")
+                self.log(f"❌ 登录请求失败: {response.status_code}")
                 return False
             
         except Exception as e:
-            print(f"❌ 登录失败: {e}")
+            self.log(f"❌ 登录失败: {e}")
             return False
     
 
@@ -406,7 +768,7 @@ class UCASOffersMonitor:
 
             if response.status_code == 200:
                 if not response.text.strip():
-                    print(f"❌ 服务器返回空响应")
+                    self.log(f"❌ 服务器返回空响应")
                     return None
 
                 if response.encoding is None or response.encoding == 'ISO-8859-1':
@@ -414,8 +776,8 @@ class UCASOffersMonitor:
 
                 content_type = response.headers.get('content-type', '').lower()
                 if 'application/json' not in content_type and 'text/plain' not in content_type:
-                    print(f"❌ 服务器返回非JSON格式响应，Content-Type: {content_type}")
-                    print(f"响应内容前200字符: {response.text[:200]}")
+                    self.log(f"❌ 服务器返回非JSON格式响应，Content-Type: {content_type}")
+                    self.log(f"响应内容前200字符: {response.text[:200]}")
                     return None
 
                 try:
@@ -424,42 +786,42 @@ class UCASOffersMonitor:
                     details = extract_details(data)
                     return {'count': offers_count, 'details': details}
                 except json.JSONDecodeError as json_err:
-                    print(f"❌ JSON解析失败: {json_err}")
-                    print(f"响应状态码: {response.status_code}")
-                    print(f"响应编码: {response.encoding}")
-                    print(f"原始响应长度: {len(response.content)} bytes")
-                    print(f"文本响应长度: {len(response.text)} chars")
-                    print(f"响应内容前200字符: {repr(response.text[:200])}")
+                    self.log(f"❌ JSON解析失败: {json_err}")
+                    self.log(f"响应状态码: {response.status_code}")
+                    self.log(f"响应编码: {response.encoding}")
+                    self.log(f"原始响应长度: {len(response.content)} bytes")
+                    self.log(f"文本响应长度: {len(response.text)} chars")
+                    self.log(f"响应内容前200字符: {repr(response.text[:200])}")
                     try:
                         for encoding in ['utf-8', 'utf-8-sig', 'gbk', 'gb2312']:
                             try:
                                 decoded_text = response.content.decode(encoding)
                                 test_data = json.loads(decoded_text)
-                                print(f"使用 {encoding} 编码成功解析")
+                                self.log(f"使用 {encoding} 编码成功解析")
                                 offers_count = test_data.get('numberOfOffersMade', -999)
                                 details = extract_details(test_data)
                                 return {'count': offers_count, 'details': details}
                             except (UnicodeDecodeError, json.JSONDecodeError):
                                 continue
                     except Exception as fallback_err:
-                        print(f"❌ 编码修复尝试失败: {fallback_err}")
+                        self.log(f"❌ 编码修复尝试失败: {fallback_err}")
                     return None
 
             elif response.status_code == 401:
                 return 'AUTH_FAILED'
             else:
-                print(f"❌ 请求失败，状态码: {response.status_code}")
-                print(f"响应内容: {response.text[:200]}")
+                self.log(f"❌ 请求失败，状态码: {response.status_code}")
+                self.log(f"响应内容: {response.text[:200]}")
                 return None
 
         except requests.exceptions.Timeout:
-            print(f"❌ 请求超时")
+            self.log(f"❌ 请求超时")
             return None
         except requests.exceptions.RequestException as req_err:
-            print(f"❌ 网络请求失败: {req_err}")
+            self.log(f"❌ 网络请求失败: {req_err}")
             return None
         except Exception as e:
-            print(f"❌ 获取offers信息失败: {e}")
+            self.log(f"❌ 获取offers信息失败: {e}")
             return None
     
     def is_london_dst(self, dt):
@@ -475,57 +837,40 @@ class UCASOffersMonitor:
         
         return dst_start <= dt < dst_end
     
-    def send_bark_notification(self, title, message, critical=True):
+    def send_notification(self, title, message, critical=True):
         try:
-            bark_key = self.config.get('bark_key')
-            if not bark_key:
-                return True
-            
-            encoded_message = quote(message)
-            encoded_title = quote(title)
-            base = f"https://api.day.app/{bark_key}/{encoded_message}?title={encoded_title}&icon=https://data.musestar.cc/files/ms.png"
-            url = base if not critical else f"{base}&level=critical&volume=10&call=1"
-            
-            response = requests.get(url)
-            if response.status_code == 200:
-                print(f"推送通知已发送")
-                return True
-            else:
-                print(f"推送失败，仅控制台显示")
-                return False
-                
+            return self.dispatcher.dispatch(build_notifiers(self.config, self.log), title, message, critical, self.log)
         except Exception as e:
-            print(f"推送通知失败: {e}")
+            self.log(f"推送通知失败: {e}")
             return False
     
     def handle_auth_failure(self):
         if not self.config.get('username') or not self.config.get('password'):
             message = "Cookies已失效，但未保存账号密码，无法自动重新登录"
-            print(f"❌ UCAS登录失效: {message}")
-            self.send_bark_notification("❌ UCAS登录失效", message, critical=False)
+            self.log(f"❌ UCAS登录失效: {message}")
+            self.send_notification("❌ UCAS登录失效", message, critical=False)
             return False
         
         if self.login_retry_count >= self.max_login_retries:
             message = f"已尝试{self.max_login_retries}次重新登录均失败，请检查问题"
-            print(f"❌ UCAS登录失败: {message}")
-            self.send_bark_notification("❌ UCAS登录失败", message, critical=False)
+            self.log(f"❌ UCAS登录失败: {message}")
+            self.send_notification("❌ UCAS登录失败", message, critical=False)
             return False
         
         self.login_retry_count += 1
-        print(f"Cookies失效，尝试第{self.login_retry_count}次重新登录")
+        self.log(f"Cookies失效，尝试第{self.login_retry_count}次重新登录")
         
         if self.login_with_credentials():
-            self.save_config()
-            print("重新登录成功，继续监控")
+            self.log("重新登录成功，继续监控")
             self.login_retry_count = 0
             return True
         else:
-            print(f"❌ 第{self.login_retry_count}次重新登录失败")
+            self.log(f"❌ 第{self.login_retry_count}次重新登录失败")
             return False
 
     def monitor_offers(self):
         
-        while True:
+        while not self.stop_event.is_set():
             try:
                 if ZoneInfo:
                     now_ldn = datetime.now(ZoneInfo('Europe/London'))
@@ -546,8 +891,8 @@ class UCASOffersMonitor:
                     else:
                         next_start = (now_ldn + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
                     sleep_seconds = max(60, int((next_start - now_ldn).total_seconds()))
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 非监测时段（伦敦时间8:00-20:00），待机至 {next_start.strftime('%Y-%m-%d %H:%M')}")
-                    time.sleep(sleep_seconds)
+                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.account}] 非监测时段（伦敦时间8:00-20:00），待机至 {next_start.strftime('%Y-%m-%d %H:%M')}")
+                    self.stop_event.wait(sleep_seconds)
                     continue
 
                 info = self.get_offers_info()
@@ -561,7 +906,7 @@ class UCASOffersMonitor:
                 if current_offers is not None:
                     if self.last_offers_count is None:
                         self.last_offers_count = current_offers
-                        print(f"初始化监控，当前offers数量: {current_offers}")
+                        self.log(f"初始化监控，当前offers数量: {current_offers}")
                     elif current_offers != self.last_offers_count:
                         change = current_offers - self.last_offers_count
                         if change > 0:
@@ -580,14 +925,14 @@ class UCASOffersMonitor:
                             title = "Offers状态更新"
                             message = f"您的offers数量从 {self.last_offers_count} 变更为 {current_offers}"
                         
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
-                        self.send_bark_notification(title, message)
+                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.account}] {message}")
+                        self.send_notification(title, message)
                         self.last_offers_count = current_offers
                     else:
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 当前offers数量: {current_offers} (无变化)")
+                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.account}] 当前offers数量: {current_offers} (无变化)")
                 else:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 获取offers信息失败，监控已停止")
-                    self.send_bark_notification("❌ 监控已停止", "获取UCAS数据失败，监控已停止，请检查网络或登录状态", critical=False)
+                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.account}] 获取offers信息失败，监控已停止")
+                    self.send_notification("❌ 监控已停止", "获取UCAS数据失败，监控已停止，请检查网络或登录状态", critical=False)
                     break
                 
                 if ZoneInfo:
@@ -600,31 +945,18 @@ class UCASOffersMonitor:
                     now_ldn_sleep = now_utc_sleep + timedelta(hours=london_offset_sleep)
                     end_ldn_sleep = datetime(now_ldn_sleep.year, now_ldn_sleep.month, now_ldn_sleep.day, 20, 0, 0)
                 seconds_to_end = max(1, int((end_ldn_sleep - now_ldn_sleep).total_seconds()))
-                time.sleep(min(180, seconds_to_end))
+                self.stop_event.wait(min(180, seconds_to_end))
                 
             except KeyboardInterrupt:
                 print("\n监控已停止")
                 break
             except Exception as e:
-                print(f"监控过程中发生错误: {e}")
-                self.send_bark_notification("❌ 监控已停止", f"发生错误: {e}", critical=False)
+                self.log(f"监控过程中发生错误: {e}")
+                self.send_notification("❌ 监控已停止", f"发生错误: {e}", critical=False)
                 break
     
-    def run(self):
-        show_muse_banner()
-        
-        if self.config.get('cookies'):
-            print("检测到已有配置")
-            use_existing = input("是否使用现有配置？(y/n): ").lower()
-            if use_existing != 'y':
-                if not self.setup_config():
-                    return False
-        else:
-            print("未检测到配置文件")
-            if not self.setup_config():
-                return False
-        
-        print("正在测试配置")
+    def check_config(self):
+        self.log("正在测试配置")
         info = self.get_offers_info()
         offers_count = info if isinstance(info, (str, type(None))) else info.get('count')
         
@@ -635,27 +967,123 @@ class UCASOffersMonitor:
             offers_count = info if isinstance(info, (str, type(None))) else info.get('count')
         
         if offers_count is not None and offers_count != 'AUTH_FAILED':
-            print(f"配置测试成功，当前offers数量: {offers_count}")
-            
-            if self.config.get('bark_key'):
-                test_notification = input("是否发送测试通知？(y/n): ").lower()
-                if test_notification == 'y':
-                    self.send_bark_notification("🔔UCAS监控测试", "监控脚本配置成功，开始监控offers变化")
-            else:
-                print("未配置Bark密钥，跳过推送通知")
+            self.log(f"配置测试成功，当前offers数量: {offers_count}")
+            return True
         else:
-            print("❌ 配置测试失败")
+            self.log("❌ 配置测试失败")
             return False
+
+    def stop(self):
+        self.stop_event.set()
+
+class MonitorManager:
+    def __init__(self, store=None):
+        self.store = store or ConfigStore()
+        self.dispatcher = NotificationDispatcher()
+        self.monitors = {}
+        self.threads = {}
+        self.watch_interval = 5
+
+    def setup_account(self):
+        account = input("请输入账号名称 (直接回车使用 default): ").strip()
+        account = self.store.normalize_account(account)
+        return UCASOffersMonitor(self.store, account, self.dispatcher).setup_config()
+
+    def run_monitor(self, monitor, checked):
+        if not checked and not monitor.check_config():
+            return
+        monitor.monitor_offers()
+
+    def start_account(self, account, checked_monitor=None):
+        monitor = checked_monitor or UCASOffersMonitor(self.store, account, self.dispatcher)
+        thread = threading.Thread(target=self.run_monitor, args=(monitor, checked_monitor is not None), name=f"monitor-{account}", daemon=True)
+        self.monitors[account] = monitor
+        self.threads[account] = thread
+        thread.start()
+
+    def stop_account(self, account):
+        monitor = self.monitors.pop(account, None)
+        self.threads.pop(account, None)
+        if monitor:
+            monitor.stop()
+
+    def watch_accounts(self):
+        idle_reported = False
+        while True:
+            time.sleep(self.watch_interval)
+            added, removed, modified = self.store.poll_changes()
+            for account in removed:
+                print(f"[{account}] 账号配置已移除，停止监控")
+                self.stop_account(account)
+            for account in added:
+                print(f"[{account}] 检测到新账号配置，开始监控")
+                self.start_account(account)
+            for account in modified:
+                monitor = self.monitors.get(account)
+                thread = self.threads.get(account)
+                if monitor and thread and thread.is_alive():
+                    print(f"[{account}] 账号配置已更新，重新加载")
+                    monitor.reload_config()
+                else:
+                    print(f"[{account}] 账号配置已更新，重新开始监控")
+                    self.start_account(account)
+            if any(thread.is_alive() for thread in self.threads.values()):
+                idle_reported = False
+            elif not idle_reported:
+                print("所有账号监控均已停止，新增或修改账号配置后将自动开始监控，按 Ctrl+C 退出")
+                idle_reported = True
+
+    def run(self):
+        try:
+            return self.start()
+        finally:
+            self.dispatcher.close()
+
+    def start(self):
+        show_muse_banner()
+        
+        accounts = self.store.list_accounts()
+        if accounts:
+            print(f"检测到已有配置: {', '.join(accounts)}")
+            use_existing = input("是否使用现有配置？(y/n): ").lower()
+            if use_existing != 'y':
+                if not self.setup_account():
+                    return False
+        else:
+            print("未检测到配置文件")
+            if not self.setup_account():
+                return False
+        
+        self.store.poll_changes()
+        checked = [m for m in (UCASOffersMonitor(self.store, a, self.dispatcher) for a in self.store.list_accounts()) if m.check_config()]
+        if not checked:
+            print("❌ 配置测试失败")
+        
+        if any(build_notifiers(m.config, m.log) for m in checked):
+            test_notification = input("是否发送测试通知？(y/n): ").lower()
+            if test_notification == 'y':
+                for monitor in checked:
+                    monitor.send_notification("🔔UCAS监控测试", "监控脚本配置成功，开始监控offers变化")
+        elif checked:
+            print("未配置推送渠道，跳过推送通知")
         
         print("\n开始监控UCAS Offers变化")
-        self.monitor_offers()
+        for monitor in checked:
+            self.start_account(monitor.account, monitor)
+        try:
+            self.watch_accounts()
+        except KeyboardInterrupt:
+            print("\n监控已停止")
+        finally:
+            for account in list(self.monitors):
+                self.stop_account(account)
         return True
 
 def main():
     while True:
         try:
-            monitor = UCASOffersMonitor()
-            success = monitor.run()
+            manager = MonitorManager()
+            success = manager.run()
             if not success:
                 print("\n程序配置或运行失败")
         except KeyboardInterrupt: